@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, TypeVar, Generic, Set
+from typing import Any, Dict, TypeVar, Generic, AbstractSet
 
 from ._types_and_defaults import *
 from ..exceptions import InvalidEdrJsonError
@@ -15,6 +15,9 @@ class EdrModel(ABC, Generic[T]):
     It declares the standard methods for serialising to & from JSON that concrete implementations are expected to
     provide.
     """
+    # Declared empty so that subclasses can use __slots__ to avoid having a per-instance __dict__. Subclasses that don't
+    # declare __slots__ of their own still get a __dict__ as usual
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         """This is here so that the signature matches what we use in the `from_json` method"""
@@ -38,7 +41,7 @@ class EdrModel(ABC, Generic[T]):
 
     @classmethod
     @abstractmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
+    def _get_allowed_json_keys(cls) -> AbstractSet[str]:
         """
         Get valid keys for the JSON representation of this object. Used by the `from_json` method.
         Creating an abstract class method was the best option for signposting the need to implement this in subclasses.
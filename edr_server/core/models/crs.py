@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Any, Set
 
 from pyproj import CRS
@@ -38,7 +39,34 @@ class CrsObject(EdrModel["CrsObject"], CRS):
 
     @classmethod
     def from_json(cls, json_dict: Dict[str, Any]) -> "CrsObject":
-        return CrsObject.from_wkt(json_dict["wkt"])
+        return _crs_from_wkt(json_dict["wkt"])
+
+    def to_wkt(self, *args, **kwargs) -> str:
+        # Generating WKT goes through PROJ, which is comparatively slow, and it happens every time a CRS is serialised
+        # or hashed. CRS objects are immutable, so cache the WKT for each combination of arguments it's requested with
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            wkt_cache = self._wkt_cache
+        except AttributeError:
+            wkt_cache = self._wkt_cache = {}
+
+        if (wkt := wkt_cache.get(key)) is None:
+            wkt = wkt_cache[key] = super().to_wkt(*args, **kwargs)
+        return wkt
+
+    def __eq__(self, other: Any) -> bool:
+        # The inherited comparison goes through PROJ, which is comparatively slow. Comparing an object to itself is
+        # common (e.g. the shared DEFAULT_CRS), so short-circuit that case before falling back to the full check
+        return self is other or super().__eq__(other)
+
+    def __hash__(self) -> int:
+        # The inherited implementation hashes the generated WKT on every call. CRS objects are immutable, so the hash
+        # can be calculated once and reused
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = super().__hash__()
+            return self._hash
 
     def __repr__(self):
         # Inherited pyproj.CRS.__repr__ converts to wkt, which is looooong. This will check whether we can identify a
@@ -50,6 +78,15 @@ class CrsObject(EdrModel["CrsObject"], CRS):
         return f"CrsObject({arg!r})"
 
 
+@lru_cache(maxsize=256)
+def _crs_from_wkt(wkt: str) -> CrsObject:
+    """
+    Parsing WKT goes through PROJ, and the same handful of CRSs tend to appear over and over again in EDR JSON.
+    CRS objects are immutable, so it's safe to hand out the same instance for repeated WKT.
+    """
+    return CrsObject.from_wkt(wkt)
+
+
 DEFAULT_CRS = CrsObject(4326)
 DEFAULT_VRS = CrsObject(
     'VERTCS["WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137.0,298.257223563]],'
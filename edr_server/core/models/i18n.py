@@ -1,5 +1,5 @@
 from collections import UserDict
-from typing import Literal, get_args, Dict, Any, Set
+from typing import Literal, get_args, Dict, Any, FrozenSet
 
 from . import EdrModel, JsonDict
 
@@ -17,6 +17,8 @@ Iso639Alpha2LanguageCode = Literal[
 ]  # We could use pycountry here, but it's overkill for a single static list
 
 VALID_LANGUAGE_CODES = get_args(Iso639Alpha2LanguageCode)
+# Membership is checked for every key set on a LanguageMap, and the whole set is needed by `from_json`, so build it once
+_VALID_LANGUAGE_CODES_SET = frozenset(VALID_LANGUAGE_CODES)
 
 
 class LanguageMap(UserDict, EdrModel["LanguageMap"]):
@@ -31,8 +33,8 @@ class LanguageMap(UserDict, EdrModel["LanguageMap"]):
         return json_dict
 
     @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return set(VALID_LANGUAGE_CODES)
+    def _get_allowed_json_keys(cls) -> FrozenSet[str]:
+        return _VALID_LANGUAGE_CODES_SET
 
     def to_json(self) -> Dict[str, Any]:
         return dict(**self)
@@ -41,7 +43,7 @@ class LanguageMap(UserDict, EdrModel["LanguageMap"]):
         return super().__getitem__(key)
 
     def __setitem__(self, key: str, value: str):
-        if key not in VALID_LANGUAGE_CODES:
+        if key not in _VALID_LANGUAGE_CODES_SET:
             raise ValueError(f"{key!r} is not a valid ISO 639-1 language code")
         if not isinstance(value, str):
             raise ValueError(f"Value must be a str! key={key!r}; value={value!r}")
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from contextlib import suppress
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, TypeVar, Set, Type
+from typing import List, Optional, Dict, Any, TypeVar, Type, FrozenSet, ClassVar
 
 from . import EdrModel, JsonDict
 from ._types_and_defaults import EdrDataQuery
@@ -56,6 +56,9 @@ class Link(EdrModel["Link"]):
     hreflang: Optional[Iso639Alpha2LanguageCode] = None
     title: Optional[str] = None
     length: Optional[int] = None
+    # As with the data queries, subclasses should extend this with a set union. ClassVar stops dataclass treating it as
+    # a field
+    _ALLOWED_JSON_KEYS: ClassVar[FrozenSet[str]] = frozenset({"title", "href", "rel", "type", "hreflang", "length"})
 
     @classmethod
     def _prepare_json_for_init(cls, json_dict: JsonDict) -> JsonDict:
@@ -63,8 +66,8 @@ class Link(EdrModel["Link"]):
         return json_dict
 
     @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return {"title", "href", "rel", "type", "hreflang", "length"}
+    def _get_allowed_json_keys(cls) -> FrozenSet[str]:
+        return cls._ALLOWED_JSON_KEYS
 
     def to_json(self) -> Dict[str, Any]:
         encoded_link = {
@@ -89,6 +92,12 @@ U = TypeVar("U", bound="AbstractDataQuery")
 
 
 class AbstractDataQuery(EdrModel[U]):
+    # Data queries are created in large numbers when building collection metadata, so use slots to avoid giving each
+    # instance a __dict__. Subclasses that add attributes must list them in their own __slots__
+    __slots__ = ("_title", "_description")
+    # Checked against the keys of every JSON dict passed to `from_json`. Subclasses that accept extra keys should extend
+    # this with a set union, rather than overriding `_get_allowed_json_keys`, so that the set is only built once
+    _ALLOWED_JSON_KEYS: ClassVar[FrozenSet[str]] = frozenset({"title", "description", "query_type"})
 
     @classmethod
     def _prepare_json_for_init(cls, json_dict: JsonDict) -> JsonDict:
@@ -104,16 +113,16 @@ class AbstractDataQuery(EdrModel[U]):
 
         Creates a shallow copy of the input dict, so be careful about modifying nested lists/dicts in place!
         """
-        kwargs = json_dict.copy()
+        if "query_type" not in json_dict:
+            return json_dict.copy()
 
-        if "query_type" in json_dict:
-            expected_query_type = cls.get_query_type().name.lower()
-            if json_dict["query_type"] != expected_query_type:
-                raise InvalidEdrJsonError(
-                    f"JSON has 'query_type'={json_dict['query_type']!r} but {expected_query_type!r} was expected")
-            del kwargs["query_type"]
+        expected_query_type = cls.get_query_type().value
+        if json_dict["query_type"] != expected_query_type:
+            raise InvalidEdrJsonError(
+                f"JSON has 'query_type'={json_dict['query_type']!r} but {expected_query_type!r} was expected")
 
-        return kwargs
+        # Build the copy without query_type, rather than copying everything and then deleting it
+        return {k: v for k, v in json_dict.items() if k != "query_type"}
 
     @classmethod
     @abstractmethod
@@ -124,8 +133,8 @@ class AbstractDataQuery(EdrModel[U]):
         raise NotImplementedError
 
     @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return {"title", "description", "query_type"}
+    def _get_allowed_json_keys(cls) -> FrozenSet[str]:
+        return cls._ALLOWED_JSON_KEYS
 
     def __init__(self, title: Optional[str] = None, description: Optional[str] = None):
         super().__init__(self)
@@ -159,6 +168,8 @@ class AbstractDataQuery(EdrModel[U]):
         Returns `True` if argument is equal to this object, `False` otherwise.
         You shouldn't need to modify this method, just override and extend the `_key()` method
         """
+        if self is other:  # Avoids building both keys, and comparing the lists in them element by element
+            return True
         return self._key() == other._key() if isinstance(other, AbstractDataQuery) else False
 
     @abstractmethod
@@ -186,8 +197,9 @@ class AbstractDataQuery(EdrModel[U]):
 
     def to_json(self) -> Dict[str, Any]:
         # Docstring inherited from EdrModel
+        # The enum values are already the lowercase query type names, so there's no need to build a new string
         j_dict = {
-            "query_type": self.get_query_type().name.lower()
+            "query_type": self.get_query_type().value
         }
         if self._title is not None:
             j_dict["title"] = self._title
@@ -198,6 +210,7 @@ class AbstractDataQuery(EdrModel[U]):
 
 
 class ItemsDataQuery(AbstractDataQuery["ItemsDataQuery"]):
+    __slots__ = ()
 
     def __init__(
             self,
@@ -222,6 +235,9 @@ class AbstractSpatialDataQuery(AbstractDataQuery[E]):
     The Data Query objects describe any metadata that's specific to particular EDR queries.
     They are tied to specific collections, and hence can vary from collection to collection.
     """
+    __slots__ = ("_output_formats", "_default_output_format", "_crs_details")
+    _ALLOWED_JSON_KEYS = AbstractDataQuery._ALLOWED_JSON_KEYS | {
+        "output_formats", "default_output_format", "crs_details"}
 
     def __init__(
             self, title: Optional[str] = None, description: Optional[str] = None,
@@ -241,10 +257,6 @@ class AbstractSpatialDataQuery(AbstractDataQuery[E]):
 
         self._crs_details = [DEFAULT_CRS] if crs_details is None else crs_details
 
-    @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return super()._get_allowed_json_keys().union({"output_formats", "default_output_format", "crs_details"})
-
     @classmethod
     def _prepare_json_for_init(cls, json_dict: JsonDict) -> JsonDict:
         """
@@ -309,6 +321,8 @@ class AbstractSpatialDataQuery(AbstractDataQuery[E]):
         if self._default_output_format is not None:
             j_dict["default_output_format"] = self._default_output_format
         if self._crs_details is not None:
+            # crs_details can be modified after the data query is created, so it's serialised afresh every time.
+            # CrsObject caches its own WKT, so this doesn't repeat the expensive PROJ calls
             j_dict["crs_details"] = {crs.name: crs.to_json() for crs in self._crs_details}
 
         return j_dict
@@ -316,6 +330,7 @@ class AbstractSpatialDataQuery(AbstractDataQuery[E]):
 
 class AreaDataQuery(AbstractSpatialDataQuery["AreaDataQuery"]):
     """Class that describes any metadata that's specific to Area queries"""
+    __slots__ = ()
 
     @classmethod
     def get_query_type(cls) -> EdrDataQuery:
@@ -327,6 +342,8 @@ class AreaDataQuery(AbstractSpatialDataQuery["AreaDataQuery"]):
 
 class CorridorDataQuery(AbstractSpatialDataQuery["CorridorDataQuery"]):
     """Collection-specific metadata for corridor queries"""
+    __slots__ = ("_width_units", "_height_units")
+    _ALLOWED_JSON_KEYS = AbstractSpatialDataQuery._ALLOWED_JSON_KEYS | {"width_units", "height_units"}
 
     def __init__(
             self,
@@ -338,10 +355,6 @@ class CorridorDataQuery(AbstractSpatialDataQuery["CorridorDataQuery"]):
         self._width_units = width_units
         self._height_units = height_units
 
-    @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return super()._get_allowed_json_keys().union({"width_units", "height_units"})
-
     @classmethod
     def get_query_type(cls) -> EdrDataQuery:
         # docstring inherited
@@ -381,6 +394,8 @@ class CorridorDataQuery(AbstractSpatialDataQuery["CorridorDataQuery"]):
 
 class CubeDataQuery(AbstractSpatialDataQuery["CubeDataQuery"]):
     """Collection-specific metadata for cube queries"""
+    __slots__ = ("_height_units",)
+    _ALLOWED_JSON_KEYS = AbstractSpatialDataQuery._ALLOWED_JSON_KEYS | {"height_units"}
 
     def __init__(
             self,
@@ -391,10 +406,6 @@ class CubeDataQuery(AbstractSpatialDataQuery["CubeDataQuery"]):
         super().__init__(title, description, output_formats, default_output_format, crs_details)
         self._height_units = height_units
 
-    @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return super()._get_allowed_json_keys().union({"height_units"})
-
     @classmethod
     def get_query_type(cls) -> EdrDataQuery:
         # docstring inherited
@@ -419,6 +430,7 @@ class CubeDataQuery(AbstractSpatialDataQuery["CubeDataQuery"]):
 
 class LocationsDataQuery(AbstractSpatialDataQuery["LocationsDataQuery"]):
     """Collection-specific metadata for locations queries"""
+    __slots__ = ()
 
     @classmethod
     def get_query_type(cls) -> EdrDataQuery:
@@ -430,6 +442,7 @@ class LocationsDataQuery(AbstractSpatialDataQuery["LocationsDataQuery"]):
 
 class PositionDataQuery(AbstractSpatialDataQuery["PositionDataQuery"]):
     """Collection-specific metadata for locations queries"""
+    __slots__ = ()
 
     @classmethod
     def get_query_type(cls) -> EdrDataQuery:
@@ -440,6 +453,9 @@ class PositionDataQuery(AbstractSpatialDataQuery["PositionDataQuery"]):
 
 
 class RadiusDataQuery(AbstractSpatialDataQuery["RadiusDataQuery"]):
+    __slots__ = ("_within_units",)
+    _ALLOWED_JSON_KEYS = AbstractSpatialDataQuery._ALLOWED_JSON_KEYS | {"within_units"}
+
     def __init__(
             self, title: Optional[str] = None, description: Optional[str] = None,
             output_formats: Optional[List[str]] = None, default_output_format: Optional[str] = None,
@@ -448,10 +464,6 @@ class RadiusDataQuery(AbstractSpatialDataQuery["RadiusDataQuery"]):
         super().__init__(title, description, output_formats, default_output_format, crs_details)
         self._within_units = within_units
 
-    @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return super()._get_allowed_json_keys().union({"within_units"})
-
     def to_json(self) -> JsonDict:
         j_dict = super().to_json()
         if self._within_units:
@@ -471,6 +483,7 @@ class RadiusDataQuery(AbstractSpatialDataQuery["RadiusDataQuery"]):
 
 
 class TrajectoryDataQuery(AbstractSpatialDataQuery["TrajectoryDataQuery"]):
+    __slots__ = ()
 
     def _key(self) -> tuple:
         return super()._key()
@@ -500,10 +513,7 @@ class DataQueryLink(Link):
 
     """
     variables: Optional[AbstractDataQuery] = None
-
-    @classmethod
-    def _get_allowed_json_keys(cls) -> Set[str]:
-        return super()._get_allowed_json_keys().union({"templated", "variables"})
+    _ALLOWED_JSON_KEYS: ClassVar[FrozenSet[str]] = Link._ALLOWED_JSON_KEYS | {"templated", "variables"}
 
     @classmethod
     def _prepare_json_for_init(cls, json_dict: JsonDict) -> JsonDict:
@@ -523,7 +533,8 @@ class DataQueryLink(Link):
                 # The awkwardness with that would be how would `CollectionMetadata` know to call it? We'd need a more
                 # specialised exception subclass to identify that error case from other invalid JSON errors
                 raise InvalidEdrJsonError("'query_type' missing from data query JSON")
-            data_query_cls = DATA_QUERY_MAP[actual_query_type]
+            if (data_query_cls := DATA_QUERY_MAP.get(actual_query_type)) is None:
+                raise InvalidEdrJsonError(f"Unrecognised 'query_type' in data query JSON: {actual_query_type!r}")
             json_dict["variables"] = data_query_cls.from_json(json_dict["variables"])
 
         with suppress(KeyError):
@@ -1,6 +1,8 @@
 import unittest
+from unittest.mock import patch
 
 import pytest
+from pyproj import CRS
 
 from edr_server.core.models.crs import CrsObject, DEFAULT_CRS, DEFAULT_VRS, DEFAULT_TRS
 
@@ -43,6 +45,48 @@ class CrsObjectTest(unittest.TestCase):
         actual = CrsObject.from_json({"crs": "WGS 84", "wkt": self.WGS84_WKT})
         self.assertEqual(expected, actual)
 
+    def test_from_json_repeated_wkt(self):
+        json_dict = {"crs": "WGS 84", "wkt": self.WGS84_WKT}
+        self.assertIs(CrsObject.from_json(json_dict), CrsObject.from_json(json_dict))
+
+    def test_to_wkt(self):
+        crs = CrsObject(4326)
+        wkt = crs.to_wkt()
+        # pyproj returns a new string on every call, so getting the same object back shows it came from the cache
+        self.assertIs(wkt, crs.to_wkt())
+        self.assertEqual(wkt, CrsObject(4326).to_wkt())
+
+        # Different arguments get their own cache entry, rather than returning the WKT cached for the first call
+        pretty_wkt = crs.to_wkt(pretty=True)
+        self.assertNotEqual(wkt, pretty_wkt)
+        self.assertIs(pretty_wkt, crs.to_wkt(pretty=True))
+        self.assertIs(wkt, crs.to_wkt())
+        self.assertEqual(CrsObject(4326).to_wkt(pretty=True), pretty_wkt)
+
+    def test__hash__(self):
+        crs = CrsObject(4326)
+        self.assertEqual(hash(crs), hash(crs))
+        self.assertEqual(hash(CrsObject(4326)), hash(crs))
+        self.assertNotEqual(hash(CrsObject(4277)), hash(crs))
+
+    def test__hash__cached(self):
+        crs = CrsObject(4326)
+        with patch.object(CRS, "__hash__", autospec=True, side_effect=CRS.__hash__) as mock_hash:
+            expected_hash = hash(crs)
+            self.assertEqual(expected_hash, hash(crs))
+
+        mock_hash.assert_called_once_with(crs)
+
+    def test__eq__same_instance(self):
+        crs = CrsObject(4326)
+        with patch.object(CRS, "__eq__", autospec=True, side_effect=CRS.__eq__) as mock_eq:
+            self.assertEqual(crs, crs)
+            mock_eq.assert_not_called()  # Comparing an object to itself shouldn't need the full comparison
+
+            other_crs = CrsObject(4326)
+            self.assertEqual(crs, other_crs)
+            mock_eq.assert_called_once_with(crs, other_crs)
+
 
 @pytest.mark.parametrize("default, expected", (
         (DEFAULT_CRS, CrsObject(4326)),
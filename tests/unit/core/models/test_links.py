@@ -1,956 +1,154 @@
 import unittest
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple, Type
 
 from edr_server.core.exceptions import InvalidEdrJsonError
-from edr_server.core.models import EdrDataQuery
-from edr_server.core.models.crs import CrsObject
-from edr_server.core.models.links import AreaDataQuery, CorridorDataQuery, CubeDataQuery, LocationsDataQuery, \
-    PositionDataQuery, ItemsDataQuery, RadiusDataQuery, TrajectoryDataQuery, DataQueryLink, DATA_QUERY_MAP
+from edr_server.core.models import EdrDataQuery, JsonDict
+from edr_server.core.models.crs import CrsObject, _crs_from_wkt
+from edr_server.core.models.links import AbstractDataQuery, AbstractSpatialDataQuery, AreaDataQuery, \
+    CorridorDataQuery, CubeDataQuery, LocationsDataQuery, PositionDataQuery, ItemsDataQuery, RadiusDataQuery, \
+    TrajectoryDataQuery, DataQueryLink, DATA_QUERY_MAP
 from edr_server.core.models.urls import URL
 
-
-class AreaDataQueryTest(unittest.TestCase):
-
-    def setUp(self) -> None:
-        test_title = "Area Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [CrsObject(4326), CrsObject(4277), CrsObject(4188)]
-
-        self.test_area_query = AreaDataQuery(
-            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
-
-        # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/areaDataQuery.yaml
-        # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_area_data_query = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "area",
-            "output_formats": test_output_formats,
-            "default_output_format": test_output_formats[0],
-            "crs_details": {
-                crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details
-            }
-        }
-
-    def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN an AreaDataQuery is instantiated THEN default values are set"""
-        actual_area_dq = AreaDataQuery()
-
-        self.assertEqual(actual_area_dq.title, "Area Data Query")
-        self.assertEqual(actual_area_dq.description, "Select data that is within a defined area.")
-        self.assertEqual(actual_area_dq.get_query_type(), EdrDataQuery.AREA)
-        self.assertEqual(actual_area_dq.output_formats, [])
-        self.assertEqual(actual_area_dq.default_output_format, None)
-        self.assertEqual(actual_area_dq.crs_details, [CrsObject(4326)])
-
-    def test_init_default_output_format_inferred(self):
-        """
-        GIVEN output_formats is provided AND default_output_format is not
-        WHEN an AreaDataQuery is instantiated
-        THEN default_output_format is inferred from the provided output_formats
-        """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        expected_default_output_format = test_output_formats[0]
-
-        test_area_dq = AreaDataQuery(output_formats=test_output_formats)
-
-        self.assertEqual(test_area_dq.default_output_format, expected_default_output_format)
-
-    def test__eq__(self):
-        """GIVEN 2 AreaDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(AreaDataQuery(), AreaDataQuery())
-
-        adq1 = AreaDataQuery.from_json(self.test_serialised_area_data_query)
-        adq2 = AreaDataQuery.from_json(self.test_serialised_area_data_query)
-        self.assertEqual(adq1, adq2)
-
-    def test__neq__(self):
-        """GIVEN 2 AreaDataQuery objects that have different values WHEN they are compared THEN they are not equal"""
-        self.assertNotEqual(self.test_area_query, AreaDataQuery())
-        self.assertNotEqual(AreaDataQuery(), CorridorDataQuery())
-
-    def test_to_json(self):
-        """GIVEN an AreaDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_area_data_query
-
-        actual_json = self.test_area_query.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_to_json_defaults(self):
-        """
-        GIVEN an AreaDataQuery created using default values WHEN to_json() is called THEN the expected JSON is produced
-        """
-        test_area_dq = AreaDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Area Data Query",
-            "description": "Select data that is within a defined area.",
-            "query_type": "area",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_area_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_area_dq = AreaDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Area Data Query",
-            "description": "Select data that is within a defined area.",
-            "query_type": "area",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_area_dq.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_from_json(self):
-        """
-        GIVEN a dict deserialised from valid JSON for an AreaDataQuery
-        WHEN from_json() is called
-        THEN an AreaDataQuery is returned with equivalent values
-        """
-        expected_adq = self.test_area_query
-
-        actual_adq = AreaDataQuery.from_json(self.test_serialised_area_data_query)
-
-        self.assertEqual(actual_adq, expected_adq)
-
-    def test_from_json_empty_dict(self):
-        """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN an AreaDataQuery with default values is returned
-        """
-        expected_area_dq = AreaDataQuery()
-
-        actual_area_dq = AreaDataQuery.from_json({})
-
-        self.assertEqual(actual_area_dq, expected_area_dq)
-
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "area"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-
-        self.assertRaises(InvalidEdrJsonError, AreaDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN an AreaDataQuery with equivalent values is returned
-        """
-        expected_area_dq = self.test_area_query
-        test_json = self.test_serialised_area_data_query.copy()
-        del test_json["query_type"]
-
-        actual_area_dq = AreaDataQuery.from_json(test_json)
-
-        self.assertEqual(actual_area_dq, expected_area_dq)
-
-    def test_from_json_unexpected_key(self):
-        """
-        GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-        test_json = self.test_serialised_area_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
-
-        self.assertRaises(InvalidEdrJsonError, AreaDataQuery.from_json, test_json)
-
-
-class CorridorDataQueryTest(unittest.TestCase):
-
-    def setUp(self) -> None:
-        test_title = "Corridor Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [
-            CrsObject(4326), CrsObject(4277), CrsObject(4188)
-        ]
-        test_height_units = ["m", "hPa"]
-        test_width_units = ["mi", "km"]
-
-        self.test_corridor_query = CorridorDataQuery(
-            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details,
-            test_width_units, test_height_units,
-        )
-
-        # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/8427963/standard/openapi/schemas/collections/corridorDataQuery.yaml
-        # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_corridor_data_query = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "corridor",
-            "output_formats": test_output_formats,
-            "default_output_format": test_output_formats[0],
-            "crs_details": {crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details},
-            "width_units": test_width_units,
-            "height_units": test_height_units,
-        }
-
-    def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN a corridorDataQuery is instantiated THEN default values are set"""
-        actual_corridor_dq = CorridorDataQuery()
-
-        self.assertEqual(actual_corridor_dq.title, "Corridor Data Query")
-        self.assertEqual(actual_corridor_dq.description, "Select data that is within a defined corridor.")
-        self.assertEqual(actual_corridor_dq.get_query_type(), EdrDataQuery.CORRIDOR)
-        self.assertEqual(actual_corridor_dq.output_formats, [])
-        self.assertEqual(actual_corridor_dq.default_output_format, None)
-        self.assertEqual(actual_corridor_dq.crs_details, [CrsObject(4326)])
-        self.assertEqual(actual_corridor_dq.width_units, [])
-        self.assertEqual(actual_corridor_dq.height_units, [])
-
-    def test_init_default_output_format_inferred(self):
-        """
-        GIVEN output_formats is provided AND default_output_format is not
-        WHEN a corridorDataQuery is instantiated
-        THEN default_output_format is inferred from the provided output_formats
-        """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        expected_default_output_format = test_output_formats[0]
-
-        test_corridor_dq = CorridorDataQuery(output_formats=test_output_formats)
-
-        self.assertEqual(expected_default_output_format, test_corridor_dq.default_output_format)
-
-    def test__eq__(self):
-        """GIVEN 2 CorridorDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(CorridorDataQuery(), CorridorDataQuery())
-
-        cdq1 = CorridorDataQuery.from_json(self.test_serialised_corridor_data_query)
-        cdq2 = CorridorDataQuery.from_json(self.test_serialised_corridor_data_query)
-        self.assertEqual(cdq1, cdq2)
-
-    def test__neq__(self):
-        """
-        GIVEN 2 CorridorDataQuery objects that have different values WHEN they are compared THEN they are not equal
-        """
-        self.assertNotEqual(self.test_corridor_query, CorridorDataQuery())
-        self.assertNotEqual(CorridorDataQuery(), AreaDataQuery())
-
-    def test__neq__extra_fields(self):
-        """
-        This test checks that we've updated the equality comparison logic to include any attributes we've extended the
-        class with
-
-        GIVEN 2 CorridorDataQuery instances
-        AND any attributes added to the class (i.e. those not defined by the superclass) differ
-        AND inherited fields are the same
-        WHEN they are compared
-        THEN they are not equal
-        """
-        json1 = self.test_serialised_corridor_data_query.copy()
-        json1["width_units"] = ["football pitches"]
-        cdq1 = CorridorDataQuery.from_json(json1)
-        self.assertNotEqual(cdq1, self.test_corridor_query)
-
-        json2 = self.test_serialised_corridor_data_query.copy()
-        json2["height_units"] = ["Eiffel Towers"]
-        cdq2 = CorridorDataQuery.from_json(json2)
-        self.assertNotEqual(cdq2, self.test_corridor_query)
-
-    def test_to_json(self):
-        """GIVEN a corridorDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_corridor_data_query
-
-        actual_json = self.test_corridor_query.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_to_json_defaults(self):
-        """
-        GIVEN a corridorDataQuery created using default values
-        WHEN to_json() is called
-        THEN the expected JSON is produced
-        """
-        test_corridor_dq = CorridorDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Corridor Data Query",
-            "description": "Select data that is within a defined corridor.",
-            "query_type": "corridor",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_corridor_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_corridor_dq = CorridorDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Corridor Data Query",
-            "description": "Select data that is within a defined corridor.",
-            "query_type": "corridor",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_corridor_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_width_units_empty_list(self):
-        """
-        GIVEN width_units is an empty list WHEN to_json() is called THEN width_units is not included in the JSON
-        """
-        test_corridor_dq = CorridorDataQuery(width_units=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Corridor Data Query",
-            "description": "Select data that is within a defined corridor.",
-            "query_type": "corridor",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_corridor_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_height_units_empty_list(self):
-        """
-        GIVEN height_units is an empty list WHEN to_json() is called THEN height_units is not included in the JSON
-        """
-        test_corridor_dq = CorridorDataQuery(height_units=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Corridor Data Query",
-            "description": "Select data that is within a defined corridor.",
-            "query_type": "corridor",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_corridor_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_from_json(self):
-        """
-        GIVEN a dict deserialised from valid JSON for a CorridorDataQuery
-        WHEN from_json() is called
-        THEN anCorridorDataQuery is returned with equivalent values
-        """
-        expected_cdq = self.test_corridor_query
-
-        actual_cdq = CorridorDataQuery.from_json(self.test_serialised_corridor_data_query)
-
-        self.assertEqual(actual_cdq, expected_cdq)
-
-    def test_from_json_empty_dict(self):
-        """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN a corridorDataQuery with default values is returned
-        """
-        expected_corridor_dq = CorridorDataQuery()
-
-        actual_corridor_dq = CorridorDataQuery.from_json({})
-
-        self.assertEqual(actual_corridor_dq, expected_corridor_dq)
-
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "corridor"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-
-        self.assertRaises(InvalidEdrJsonError, CorridorDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN a corridorDataQuery with equivalent values is returned
-        """
-        expected_corridor_dq = self.test_corridor_query
-        test_json = self.test_serialised_corridor_data_query.copy()
-        del test_json["query_type"]
-
-        actual_corridor_dq = CorridorDataQuery.from_json(test_json)
-
-        self.assertEqual(actual_corridor_dq, expected_corridor_dq)
-
-    def test_from_json_unexpected_key(self):
-        """
-        GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-        test_json = self.test_serialised_corridor_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
-
-        self.assertRaises(InvalidEdrJsonError, CorridorDataQuery.from_json, test_json)
-
-
-class ItemsQueryTest(unittest.TestCase):
-
-    def setUp(self) -> None:
-        test_title = "Items Data Query"
-        test_description = "This is a description that doesn't describe anything"
-
-        self.test_items_query = ItemsDataQuery(test_title, test_description)
-
-        # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/itemsDataQuery.yaml
-        # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_items_data_query = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "items",
-        }
-
-    def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN an ItemsDataQuery is instantiated THEN default values are set"""
-        actual_items_dq = ItemsDataQuery()
-
-        self.assertEqual(actual_items_dq.title, "Items Data Query")
-        self.assertEqual(
-            actual_items_dq.description, "Select data based on predetermined groupings of data organised into items.")
-        self.assertEqual(actual_items_dq.get_query_type(), EdrDataQuery.ITEMS)
-
-    def test__eq__(self):
-        """GIVEN 2 ItemsDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(ItemsDataQuery(), ItemsDataQuery())
-
-        adq1 = ItemsDataQuery.from_json(self.test_serialised_items_data_query)
-        adq2 = ItemsDataQuery.from_json(self.test_serialised_items_data_query)
-        self.assertEqual(adq1, adq2)
-
-    def test__neq__(self):
-        """GIVEN 2 ItemsDataQuery objects that have different values WHEN they are compared THEN they are not equal"""
-        self.assertNotEqual(self.test_items_query, ItemsDataQuery())
-        self.assertNotEqual(ItemsDataQuery(), CorridorDataQuery())
-
-    def test_to_json(self):
-        """GIVEN an ItemsDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_items_data_query
-
-        actual_json = self.test_items_query.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_to_json_defaults(self):
-        """
-        GIVEN an ItemsDataQuery created using default values WHEN to_json() is called THEN the expected JSON is produced
-        """
-        test_items_dq = ItemsDataQuery()
-        expected_json = {
-            "title": "Items Data Query",
-            "description": "Select data based on predetermined groupings of data organised into items.",
-            "query_type": "items",
-        }
-
-        actual_json = test_items_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_from_json(self):
-        """
-        GIVEN a dict deserialised from valid JSON for an ItemsDataQuery
-        WHEN from_json() is called
-        THEN an ItemsDataQuery is returned with equivalent values
-        """
-        expected_idq = self.test_items_query
-
-        actual_idq = ItemsDataQuery.from_json(self.test_serialised_items_data_query)
-
-        self.assertEqual(actual_idq, expected_idq)
-
-    def test_from_json_empty_dict(self):
-        """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN an ItemsDataQuery with default values is returned
-        """
-        expected_items_dq = ItemsDataQuery()
-
-        actual_items_dq = ItemsDataQuery.from_json({})
-
-        self.assertEqual(actual_items_dq, expected_items_dq)
-
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "items"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-
-        self.assertRaises(InvalidEdrJsonError, ItemsDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN an ItemsDataQuery with equivalent values is returned
-        """
-        expected_items_dq = self.test_items_query
-        test_json = self.test_serialised_items_data_query.copy()
-        del test_json["query_type"]
-
-        actual_items_dq = ItemsDataQuery.from_json(test_json)
-
-        self.assertEqual(actual_items_dq, expected_items_dq)
-
-    def test_from_json_unexpected_key(self):
-        """
-        GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-        test_title = "Items Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [CrsObject(4326), CrsObject(4277), CrsObject(4188)]
-        test_json = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "items",
-            # The fields below this point aren't valid for Items Data Queries
-            "output_formats": test_output_formats,
-            "default_output_format": test_output_formats[0],
-            "crs_details": {crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details},
-        }
-
-        self.assertRaises(InvalidEdrJsonError, ItemsDataQuery.from_json, test_json)
-
-
-class CubeDataQueryTest(unittest.TestCase):
-
-    def setUp(self) -> None:
-        test_title = "Cube Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [
-            CrsObject(4326), CrsObject(4277), CrsObject(4188)
-        ]
-        test_height_units = ["m", "hPa"]
-
-        self.test_cube_query = CubeDataQuery(
-            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details,
-            test_height_units,
-        )
-
-        # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/8427963/standard/openapi/schemas/collections/cubeDataQuery.yaml
-        # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_cube_data_query = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "cube",
-            "output_formats": test_output_formats,
-            "default_output_format": test_output_formats[0],
-            "crs_details": {crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details},
-            "height_units": test_height_units,
-        }
-
-    def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN a CubeDataQuery is instantiated THEN default values are set"""
-        actual_cube_dq = CubeDataQuery()
-
-        self.assertEqual(actual_cube_dq.title, "Cube Data Query")
-        self.assertEqual(actual_cube_dq.description, "Select data that is within a defined cube.")
-        self.assertEqual(actual_cube_dq.get_query_type(), EdrDataQuery.CUBE)
-        self.assertEqual(actual_cube_dq.output_formats, [])
-        self.assertEqual(actual_cube_dq.default_output_format, None)
-        self.assertEqual(actual_cube_dq.crs_details, [CrsObject(4326)])
-        self.assertEqual(actual_cube_dq.height_units, [])
-
-    def test_init_default_output_format_inferred(self):
-        """
-        GIVEN output_formats is provided AND default_output_format is not
-        WHEN a CubeDataQuery is instantiated
-        THEN default_output_format is inferred from the provided output_formats
-        """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        expected_default_output_format = test_output_formats[0]
-
-        test_cube_dq = CubeDataQuery(output_formats=test_output_formats)
-
-        self.assertEqual(test_cube_dq.default_output_format, expected_default_output_format)
-
-    def test__eq__(self):
-        """GIVEN 2 CubeDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(CubeDataQuery(), CubeDataQuery())
-
-        cdq1 = CubeDataQuery.from_json(self.test_serialised_cube_data_query)
-        cdq2 = CubeDataQuery.from_json(self.test_serialised_cube_data_query)
-        self.assertEqual(cdq1, cdq2)
-
-    def test__neq__(self):
-        """
-        GIVEN 2 CubeDataQuery objects that have different values WHEN they are compared THEN they are not equal
-        """
-        self.assertNotEqual(self.test_cube_query, CubeDataQuery())
-        self.assertNotEqual(CubeDataQuery(), AreaDataQuery())
-
-    def test__neq__extra_fields(self):
-        """
-        This test checks that we've updated the equality comparison logic to include any attributes we've extended the
-        class with
-
-        GIVEN 2 CubeDataQuery instances
-        AND any attributes added to the class (i.e. those not defined by the superclass) differ
-        AND inherited fields are the same
-        WHEN they are compared
-        THEN they are not equal
-        """
-        json2 = self.test_serialised_cube_data_query.copy()
-        json2["height_units"] = ["Eiffel Towers"]
-        cdq2 = CubeDataQuery.from_json(json2)
-        self.assertNotEqual(cdq2, self.test_cube_query)
-
-    def test_to_json(self):
-        """GIVEN a CubeDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_cube_data_query
-
-        actual_json = self.test_cube_query.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_to_json_defaults(self):
-        """
-        GIVEN a CubeDataQuery created using default values
-        WHEN to_json() is called
-        THEN the expected JSON is produced
-        """
-        test_cube_dq = CubeDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Cube Data Query",
-            "description": "Select data that is within a defined cube.",
-            "query_type": "cube",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_cube_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_cube_dq = CubeDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Cube Data Query",
-            "description": "Select data that is within a defined cube.",
-            "query_type": "cube",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_cube_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_height_units_empty_list(self):
-        """
-        GIVEN height_units is an empty list WHEN to_json() is called THEN height_units is not included in the JSON
-        """
-        test_cube_dq = CubeDataQuery(height_units=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Cube Data Query",
-            "description": "Select data that is within a defined cube.",
-            "query_type": "cube",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_cube_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_from_json(self):
-        """
-        GIVEN a dict deserialised from valid JSON for a CubeDataQuery
-        WHEN from_json() is called
-        THEN a CubeDataQuery is returned with equivalent values
-        """
-        expected_cdq = self.test_cube_query
-
-        actual_cdq = CubeDataQuery.from_json(self.test_serialised_cube_data_query)
-
-        self.assertEqual(actual_cdq, expected_cdq)
-
-    def test_from_json_empty_dict(self):
-        """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN a CubeDataQuery with default values is returned
-        """
-        expected_cube_dq = CubeDataQuery()
-
-        actual_cube_dq = CubeDataQuery.from_json({})
-
-        self.assertEqual(actual_cube_dq, expected_cube_dq)
-
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "cube"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-
-        self.assertRaises(InvalidEdrJsonError, CubeDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN a CubeDataQuery with equivalent values is returned
-        """
-        expected_cube_dq = self.test_cube_query
-        test_json = self.test_serialised_cube_data_query.copy()
-        del test_json["query_type"]
-
-        actual_cube_dq = CubeDataQuery.from_json(test_json)
-
-        self.assertEqual(actual_cube_dq, expected_cube_dq)
-
-    def test_from_json_unexpected_key(self):
-        """
-        GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-        test_json = self.test_serialised_cube_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
-
-        self.assertRaises(InvalidEdrJsonError, CubeDataQuery.from_json, test_json)
-
-
-class LocationsDataQueryTest(unittest.TestCase):
-
-    def setUp(self) -> None:
-        test_title = "Locations Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [CrsObject(4326), CrsObject(4277), CrsObject(4188)]
-
-        self.test_locations_query = LocationsDataQuery(
-            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
-
-        # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/locationsDataQuery.yaml
-        # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_locations_data_query = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "locations",
-            "output_formats": test_output_formats,
-            "default_output_format": test_output_formats[0],
-            "crs_details": {
-                crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details
-            }
+_GPS_CRS = CrsObject(4326)
+_TEST_DESCRIPTION = "This is a description that doesn't describe anything"
+_TEST_OUTPUT_FORMATS = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
+_TEST_CRS_CODES = (4326, 4277, 4188)
+# Reuse the same CRS instances throughout, so that comparing the lists can take Python's identity shortcut for each
+# element instead of asking PROJ whether two separately created CRSs are equivalent
+_TEST_CRS_DETAILS = [_GPS_CRS if code == 4326 else CrsObject(code) for code in _TEST_CRS_CODES]
+# Looking up a CRS's name and generating its WKT both go through PROJ, so only do them once for each of the CRSs used by
+# these tests, keyed by EPSG code
+_CRS_META = {code: (crs.name, crs.to_wkt()) for code, crs in zip(_TEST_CRS_CODES, _TEST_CRS_DETAILS)}
+_TEST_CRS_DETAILS_JSON = {name: {"crs": name, "wkt": wkt} for name, wkt in _CRS_META.values()}
+_GPS_CRS_NAME = _CRS_META[4326][0]
+_GPS_CRS_DETAILS_JSON = {_GPS_CRS_NAME: _TEST_CRS_DETAILS_JSON[_GPS_CRS_NAME]}
+
+
+class _DataQueryTestMixin:
+    """
+    Tests that are common to all the data query classes.
+
+    Concrete test classes should inherit from this (or one of its subclasses) and `unittest.TestCase`, set the class
+    attributes below, and set `test_query` and `test_serialised_query` (the JSON equivalent of `test_query`) in
+    `setUpClass`
+    """
+    query_cls: Type[AbstractDataQuery]
+    query_type: EdrDataQuery
+    default_title: str
+    default_description: str
+    other_query_cls: Type[AbstractDataQuery]  # A different data query class, used to check inequality
+
+    test_query: AbstractDataQuery
+    test_serialised_query: Mapping[str, Any]  # Read-only, as it's shared by all the tests in the class
+    expected_defaults_json: JsonDict  # Set by setUpClass
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Shared instance created with the default values, for tests that only need to read it
+        cls._default_instance = cls.query_cls()
+        # Several tests expect this, so build it once rather than in each test
+        cls.expected_defaults_json = cls._build_expected_defaults_json()
+
+    @classmethod
+    def _build_expected_defaults_json(cls) -> JsonDict:
+        """Build the JSON expected from a data query that was created using default values"""
+        return {
+            "title": cls.default_title,
+            "description": cls.default_description,
+            "query_type": cls.query_type.value,
         }
 
     def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN a LocationsDataQuery is instantiated THEN default values are set"""
-        actual_locations_dq = LocationsDataQuery()
-
-        self.assertEqual(actual_locations_dq.title, "Locations Data Query")
-        self.assertEqual(actual_locations_dq.description, "Select data that is within a defined location.")
-        self.assertEqual(actual_locations_dq.get_query_type(), EdrDataQuery.LOCATIONS)
-        self.assertEqual(actual_locations_dq.output_formats, [])
-        self.assertEqual(actual_locations_dq.default_output_format, None)
-        self.assertEqual(actual_locations_dq.crs_details, [CrsObject(4326)])
-
-    def test_init_default_output_format_inferred(self):
-        """
-        GIVEN output_formats is provided AND default_output_format is not
-        WHEN a LocationsDataQuery is instantiated
-        THEN default_output_format is inferred from the provided output_formats
-        """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        expected_default_output_format = test_output_formats[0]
+        """GIVEN no arguments are supplied WHEN a data query is instantiated THEN default values are set"""
+        actual_dq = self.query_cls()
 
-        test_locations_dq = LocationsDataQuery(output_formats=test_output_formats)
-
-        self.assertEqual(test_locations_dq.default_output_format, expected_default_output_format)
+        self.assertEqual(actual_dq.title, self.default_title)
+        self.assertEqual(actual_dq.description, self.default_description)
+        self.assertEqual(actual_dq.get_query_type(), self.query_type)
 
     def test__eq__(self):
-        """GIVEN 2 LocationsDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(LocationsDataQuery(), LocationsDataQuery())
+        """GIVEN 2 data query objects that have the same values WHEN they are compared THEN they are equal"""
+        self.assertEqual(self.query_cls(), self._default_instance)
 
-        adq1 = LocationsDataQuery.from_json(self.test_serialised_locations_data_query)
-        adq2 = LocationsDataQuery.from_json(self.test_serialised_locations_data_query)
-        self.assertEqual(adq1, adq2)
+        dq1 = self.query_cls.from_json(self.test_serialised_query)
+        # from_json reuses CRS instances parsed from the same WKT. Clear that cache, so that the 2nd data query gets its
+        # own CRS objects and the comparison covers separately built CRSs as well as the data queries themselves
+        _crs_from_wkt.cache_clear()
+        dq2 = self.query_cls.from_json(self.test_serialised_query)
+        self.assertEqual(dq1, dq2)
 
     def test__neq__(self):
-        """
-        GIVEN 2 LocationsDataQuery objects that have different values WHEN they are compared THEN they are not equal
-        """
-        self.assertNotEqual(self.test_locations_query, LocationsDataQuery())
-        self.assertNotEqual(LocationsDataQuery(), CorridorDataQuery())
+        """GIVEN 2 data query objects that have different values WHEN they are compared THEN they are not equal"""
+        self.assertNotEqual(self.test_query, self._default_instance)
+        self.assertNotEqual(self._default_instance, self.other_query_cls())
 
     def test_to_json(self):
-        """GIVEN a LocationsDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_locations_data_query
+        """GIVEN a data query WHEN to_json() is called THEN the expected JSON is produced"""
+        expected_json = self.test_serialised_query
 
-        actual_json = self.test_locations_query.to_json()
+        actual_json = self.test_query.to_json()
 
         self.assertEqual(actual_json, expected_json)
 
     def test_to_json_defaults(self):
         """
-        GIVEN a LocationsDataQuery created using default values
-        WHEN to_json() is called
-        THEN the expected JSON is produced
+        GIVEN a data query created using default values WHEN to_json() is called THEN the expected JSON is produced
         """
-        test_locations_dq = LocationsDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Locations Data Query",
-            "description": "Select data that is within a defined location.",
-            "query_type": "locations",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
+        test_dq = self._default_instance
+        expected_json = self.expected_defaults_json
 
-        actual_json = test_locations_dq.to_json()
+        actual_json = test_dq.to_json()
 
         self.assertEqual(expected_json, actual_json)
 
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_locations_dq = LocationsDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Locations Data Query",
-            "description": "Select data that is within a defined location.",
-            "query_type": "locations",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_locations_dq.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
     def test_from_json(self):
         """
-        GIVEN a dict deserialised from valid JSON for a LocationsDataQuery
+        GIVEN a dict deserialised from valid JSON for a data query
         WHEN from_json() is called
-        THEN a LocationsDataQuery is returned with equivalent values
+        THEN a data query is returned with equivalent values
         """
-        expected_adq = self.test_locations_query
+        expected_dq = self.test_query
 
-        actual_adq = LocationsDataQuery.from_json(self.test_serialised_locations_data_query)
+        actual_dq = self.query_cls.from_json(self.test_serialised_query)
 
-        self.assertEqual(actual_adq, expected_adq)
+        self.assertEqual(actual_dq, expected_dq)
 
     def test_from_json_empty_dict(self):
         """
         GIVEN an empty dictionary
         WHEN the empty dict is passed to from_json()
-        THEN a LocationsDataQuery with default values is returned
+        THEN a data query with default values is returned
         """
-        expected_locations_dq = LocationsDataQuery()
+        expected_dq = self._default_instance
 
-        actual_locations_dq = LocationsDataQuery.from_json({})
+        actual_dq = self.query_cls.from_json({})
 
-        self.assertEqual(actual_locations_dq, expected_locations_dq)
+        self.assertEqual(actual_dq, expected_dq)
 
     def test_from_json_query_type_wrong(self):
         """
-        GIVEN a dict where the query_type key is not "locations"
+        GIVEN a dict where the query_type key doesn't match the data query class
         WHEN the dict is passed to from_json()
         THEN an InvalidEdrJsonError is raised
         """
 
-        self.assertRaises(InvalidEdrJsonError, LocationsDataQuery.from_json, {"query_type": "wrong!"})
+        with self.assertRaisesRegex(InvalidEdrJsonError, "JSON has 'query_type'='wrong!'"):
+            self.query_cls.from_json({"query_type": "wrong!"})
 
     def test_from_json_query_type_missing(self):
         """
         GIVEN a JSON dict that doesn't have a "query_type" key
         WHEN the dict is passed to from_json()
-        THEN a LocationsDataQuery with equivalent values is returned
+        THEN a data query with equivalent values is returned
         """
-        expected_locations_dq = self.test_locations_query
-        test_json = self.test_serialised_locations_data_query.copy()
-        del test_json["query_type"]
+        expected_dq = self.test_query
+        test_json = {k: v for k, v in self.test_serialised_query.items() if k != "query_type"}
 
-        actual_locations_dq = LocationsDataQuery.from_json(test_json)
+        actual_dq = self.query_cls.from_json(test_json)
 
-        self.assertEqual(actual_locations_dq, expected_locations_dq)
+        self.assertEqual(actual_dq, expected_dq)
 
     def test_from_json_unexpected_key(self):
         """
@@ -959,595 +157,450 @@ class LocationsDataQueryTest(unittest.TestCase):
         WHEN the dict is passed to from_json()
         THEN an InvalidEdrJsonError is raised
         """
-        test_json = self.test_serialised_locations_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
-
-        self.assertRaises(InvalidEdrJsonError, LocationsDataQuery.from_json, test_json)
+        test_json = {**self.test_serialised_query, "what the hell is this?": "12355"}
 
+        with self.assertRaisesRegex(InvalidEdrJsonError, "Unexpected keys in JSON dict"):
+            self.query_cls.from_json(test_json)
 
-class PositionDataQueryTest(unittest.TestCase):
 
-    def setUp(self) -> None:
-        test_title = "Position Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [CrsObject(4326), CrsObject(4277), CrsObject(4188)]
+class _SpatialDataQueryTestMixin(_DataQueryTestMixin):
+    """Extends the common data query tests with those that are common to all the spatial data query classes"""
+    query_cls: Type[AbstractSpatialDataQuery]
+    # Constructor arguments that take a list, and that are left out of the JSON when that list is empty
+    optional_list_kwargs: Tuple[str, ...] = ("output_formats",)
 
-        self.test_position_query = PositionDataQuery(
-            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
+    test_query: AbstractSpatialDataQuery
 
-        # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/positionDataQuery.yaml
-        # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_position_data_query = {
-            "title": test_title,
-            "description": test_description,
-            "query_type": "position",
-            "output_formats": test_output_formats,
-            "default_output_format": test_output_formats[0],
-            "crs_details": {
-                crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details
-            }
-        }
+    @classmethod
+    def _build_expected_defaults_json(cls) -> JsonDict:
+        # docstring inherited
+        return {**super()._build_expected_defaults_json(), "crs_details": _GPS_CRS_DETAILS_JSON}
 
     def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN a PositionDataQuery is instantiated THEN default values are set"""
-        actual_position_dq = PositionDataQuery()
+        # docstring inherited
+        super().test_init_defaults()
+        actual_dq = self._default_instance
 
-        self.assertEqual(actual_position_dq.title, "Position Data Query")
-        self.assertEqual(actual_position_dq.description, "Select data that is within a defined position.")
-        self.assertEqual(actual_position_dq.get_query_type(), EdrDataQuery.POSITION)
-        self.assertEqual(actual_position_dq.output_formats, [])
-        self.assertEqual(actual_position_dq.default_output_format, None)
-        self.assertEqual(actual_position_dq.crs_details, [CrsObject(4326)])
+        self.assertEqual(actual_dq.output_formats, [])
+        self.assertEqual(actual_dq.default_output_format, None)
+        self.assertEqual(actual_dq.crs_details, [_GPS_CRS])
 
     def test_init_default_output_format_inferred(self):
         """
         GIVEN output_formats is provided AND default_output_format is not
-        WHEN a PositionDataQuery is instantiated
+        WHEN a data query is instantiated
         THEN default_output_format is inferred from the provided output_formats
         """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
+        test_output_formats = _TEST_OUTPUT_FORMATS
         expected_default_output_format = test_output_formats[0]
 
-        test_position_dq = PositionDataQuery(output_formats=test_output_formats)
-
-        self.assertEqual(test_position_dq.default_output_format, expected_default_output_format)
-
-    def test__eq__(self):
-        """GIVEN 2 PositionDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(PositionDataQuery(), PositionDataQuery())
-
-        adq1 = PositionDataQuery.from_json(self.test_serialised_position_data_query)
-        adq2 = PositionDataQuery.from_json(self.test_serialised_position_data_query)
-        self.assertEqual(adq1, adq2)
+        test_dq = self.query_cls(output_formats=test_output_formats)
 
-    def test__neq__(self):
-        """
-        GIVEN 2 PositionDataQuery objects that have different values WHEN they are compared THEN they are not equal
-        """
-        self.assertNotEqual(self.test_position_query, PositionDataQuery())
-        self.assertNotEqual(PositionDataQuery(), CorridorDataQuery())
-
-    def test_to_json(self):
-        """GIVEN a PositionDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_position_data_query
-
-        actual_json = self.test_position_query.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_to_json_defaults(self):
-        """
-        GIVEN a PositionDataQuery created using default values
-        WHEN to_json() is called
-        THEN the expected JSON is produced
-        """
-        test_position_dq = PositionDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Position Data Query",
-            "description": "Select data that is within a defined position.",
-            "query_type": "position",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_position_dq.to_json()
+        self.assertEqual(test_dq.default_output_format, expected_default_output_format)
 
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_position_dq = PositionDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Position Data Query",
-            "description": "Select data that is within a defined position.",
-            "query_type": "position",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_position_dq.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_from_json(self):
+    def test_to_json_empty_lists(self):
         """
-        GIVEN a dict deserialised from valid JSON for a PositionDataQuery
-        WHEN from_json() is called
-        THEN a PositionDataQuery is returned with equivalent values
+        GIVEN an optional list attribute is an empty list WHEN to_json() is called THEN it is not included in the JSON
         """
-        expected_adq = self.test_position_query
+        expected_json = self.expected_defaults_json
 
-        actual_adq = PositionDataQuery.from_json(self.test_serialised_position_data_query)
+        for kwarg in self.optional_list_kwargs:
+            with self.subTest(kwarg=kwarg):
+                actual_json = self.query_cls(**{kwarg: []}).to_json()
 
-        self.assertEqual(actual_adq, expected_adq)
+                self.assertEqual(actual_json, expected_json)
 
-    def test_from_json_empty_dict(self):
+    def test_to_json_crs_details_modified(self):
         """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN a PositionDataQuery with default values is returned
+        GIVEN a data query that has already been serialised
+        AND its crs_details list is then modified
+        WHEN to_json() is called again
+        THEN the JSON reflects the modified crs_details
         """
-        expected_position_dq = PositionDataQuery()
+        test_dq = self.query_cls(crs_details=[_GPS_CRS])
+        test_dq.to_json()
 
-        actual_position_dq = PositionDataQuery.from_json({})
+        test_dq.crs_details.extend(_TEST_CRS_DETAILS[1:])
+        actual_json = test_dq.to_json()
 
-        self.assertEqual(actual_position_dq, expected_position_dq)
+        self.assertEqual(actual_json["crs_details"], _TEST_CRS_DETAILS_JSON)
 
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "position"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-
-        self.assertRaises(InvalidEdrJsonError, PositionDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN a PositionDataQuery with equivalent values is returned
-        """
-        expected_position_dq = self.test_position_query
-        test_json = self.test_serialised_position_data_query.copy()
-        del test_json["query_type"]
 
-        actual_position_dq = PositionDataQuery.from_json(test_json)
+class AreaDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = AreaDataQuery
+    query_type = EdrDataQuery.AREA
+    default_title = "Area Data Query"
+    default_description = "Select data that is within a defined area."
+    other_query_cls = CorridorDataQuery
 
-        self.assertEqual(actual_position_dq, expected_position_dq)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Area Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
 
-    def test_from_json_unexpected_key(self):
-        """
-        GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-        test_json = self.test_serialised_position_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
+        cls.test_query = cls.query_cls(
+            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
 
-        self.assertRaises(InvalidEdrJsonError, PositionDataQuery.from_json, test_json)
+        # According to
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/areaDataQuery.yaml
+        # none of these fields are required, so they could all potentially be missing
+        cls.test_serialised_query = MappingProxyType({
+            "title": test_title,
+            "description": test_description,
+            "query_type": "area",
+            "output_formats": test_output_formats,
+            "default_output_format": test_output_formats[0],
+            "crs_details": _TEST_CRS_DETAILS_JSON
+        })
 
 
-class RadiusDataQueryTest(unittest.TestCase):
+class CorridorDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = CorridorDataQuery
+    query_type = EdrDataQuery.CORRIDOR
+    default_title = "Corridor Data Query"
+    default_description = "Select data that is within a defined corridor."
+    other_query_cls = AreaDataQuery
+    optional_list_kwargs = ("output_formats", "width_units", "height_units")
 
-    def setUp(self) -> None:
-        test_title = "Radius Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [
-            CrsObject(4326), CrsObject(4277), CrsObject(4188)
-        ]
-        test_within_units = ["m", "KM"]
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Corridor Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
+        test_height_units = ["m", "hPa"]
+        test_width_units = ["mi", "km"]
 
-        self.test_radius_query = RadiusDataQuery(
+        cls.test_query = cls.query_cls(
             test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details,
-            test_within_units
+            test_width_units, test_height_units,
         )
 
         # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/8427963/standard/openapi/schemas/collections/radiusDataQuery.yaml
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/8427963/standard/openapi/schemas/collections/corridorDataQuery.yaml
         # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_radius_data_query = {
+        cls.test_serialised_query = MappingProxyType({
             "title": test_title,
             "description": test_description,
-            "query_type": "radius",
+            "query_type": "corridor",
             "output_formats": test_output_formats,
             "default_output_format": test_output_formats[0],
-            "crs_details": {crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details},
-            "within_units": test_within_units,
-        }
+            "crs_details": _TEST_CRS_DETAILS_JSON,
+            "width_units": test_width_units,
+            "height_units": test_height_units,
+        })
 
     def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN a RadiusDataQuery is instantiated THEN default values are set"""
-        actual_radius_dq = RadiusDataQuery()
-
-        self.assertEqual("Radius Data Query", actual_radius_dq.title)
-        self.assertEqual("Select data that is within a defined radius.", actual_radius_dq.description, )
-        self.assertEqual(EdrDataQuery.RADIUS, actual_radius_dq.get_query_type())
-        self.assertEqual([], actual_radius_dq.output_formats)
-        self.assertEqual(None, actual_radius_dq.default_output_format)
-        self.assertEqual([CrsObject(4326)], actual_radius_dq.crs_details)
-        self.assertEqual([], actual_radius_dq.within_units)
-
-    def test_init_default_output_format_inferred(self):
-        """
-        GIVEN output_formats is provided AND default_output_format is not
-        WHEN a RadiusDataQuery is instantiated
-        THEN default_output_format is inferred from the provided output_formats
-        """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        expected_default_output_format = test_output_formats[0]
-
-        test_radius_dq = RadiusDataQuery(output_formats=test_output_formats)
-
-        self.assertEqual(test_radius_dq.default_output_format, expected_default_output_format)
-
-    def test__eq__(self):
-        """GIVEN 2 RadiusDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(RadiusDataQuery(), RadiusDataQuery())
-
-        rdq1 = RadiusDataQuery.from_json(self.test_serialised_radius_data_query)
-        rdq2 = RadiusDataQuery.from_json(self.test_serialised_radius_data_query)
-        self.assertEqual(rdq1, rdq2)
+        """GIVEN no arguments are supplied WHEN a corridorDataQuery is instantiated THEN default values are set"""
+        super().test_init_defaults()
+        actual_corridor_dq = self._default_instance
 
-    def test__neq__(self):
-        """
-        GIVEN 2 RadiusDataQuery objects that have different values WHEN they are compared THEN they are not equal
-        """
-        self.assertNotEqual(self.test_radius_query, RadiusDataQuery())
-        self.assertNotEqual(RadiusDataQuery(), AreaDataQuery())
+        self.assertEqual(actual_corridor_dq.width_units, [])
+        self.assertEqual(actual_corridor_dq.height_units, [])
 
     def test__neq__extra_fields(self):
         """
         This test checks that we've updated the equality comparison logic to include any attributes we've extended the
         class with
 
-        GIVEN 2 RadiusDataQuery instances
+        GIVEN 2 CorridorDataQuery instances
         AND any attributes added to the class (i.e. those not defined by the superclass) differ
         AND inherited fields are the same
         WHEN they are compared
         THEN they are not equal
         """
-        json2 = self.test_serialised_radius_data_query.copy()
-        json2["within_units"] = ["Eiffel Towers"]
-        cdq2 = RadiusDataQuery.from_json(json2)
-        self.assertNotEqual(cdq2, self.test_radius_query)
-
-    def test_to_json(self):
-        """GIVEN a RadiusDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_radius_data_query
-
-        actual_json = self.test_radius_query.to_json()
-
-        self.assertEqual(actual_json, expected_json)
-
-    def test_to_json_defaults(self):
-        """
-        GIVEN a RadiusDataQuery created using default values
-        WHEN to_json() is called
-        THEN the expected JSON is produced
-        """
-        test_radius_dq = RadiusDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Radius Data Query",
-            "description": "Select data that is within a defined radius.",
-            "query_type": "radius",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_radius_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_radius_dq = RadiusDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Radius Data Query",
-            "description": "Select data that is within a defined radius.",
-            "query_type": "radius",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_radius_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_to_json_within_units_empty_list(self):
-        """
-        GIVEN within_units is an empty list WHEN to_json() is called THEN within_units is not included in the JSON
-        """
-        test_radius_dq = RadiusDataQuery(within_units=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Radius Data Query",
-            "description": "Select data that is within a defined radius.",
-            "query_type": "radius",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
-
-        actual_json = test_radius_dq.to_json()
-
-        self.assertEqual(expected_json, actual_json)
-
-    def test_from_json(self):
-        """
-        GIVEN a dict deserialised from valid JSON for a RadiusDataQuery
-        WHEN from_json() is called
-        THEN a RadiusDataQuery is returned with equivalent values
-        """
-        expected_cdq = self.test_radius_query
-
-        actual_cdq = RadiusDataQuery.from_json(self.test_serialised_radius_data_query)
-
-        self.assertEqual(actual_cdq, expected_cdq)
-
-    def test_from_json_empty_dict(self):
-        """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN a RadiusDataQuery with default values is returned
-        """
-        expected_radius_dq = RadiusDataQuery()
-
-        actual_radius_dq = RadiusDataQuery.from_json({})
-
-        self.assertEqual(actual_radius_dq, expected_radius_dq)
-
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "radius"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-
-        self.assertRaises(InvalidEdrJsonError, RadiusDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN a RadiusDataQuery with equivalent values is returned
-        """
-        expected_radius_dq = self.test_radius_query
-        test_json = self.test_serialised_radius_data_query.copy()
-        del test_json["query_type"]
+        json1 = {**self.test_serialised_query, "width_units": ["football pitches"]}
+        cdq1 = self.query_cls.from_json(json1)
+        self.assertNotEqual(cdq1, self.test_query)
 
-        actual_radius_dq = RadiusDataQuery.from_json(test_json)
+        json2 = {**self.test_serialised_query, "height_units": ["Eiffel Towers"]}
+        cdq2 = self.query_cls.from_json(json2)
+        self.assertNotEqual(cdq2, self.test_query)
 
-        self.assertEqual(actual_radius_dq, expected_radius_dq)
 
-    def test_from_json_unexpected_key(self):
+class ItemsQueryTest(_DataQueryTestMixin, unittest.TestCase):
+    query_cls = ItemsDataQuery
+    query_type = EdrDataQuery.ITEMS
+    default_title = "Items Data Query"
+    default_description = "Select data based on predetermined groupings of data organised into items."
+    other_query_cls = CorridorDataQuery
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Items Data Query"
+        test_description = _TEST_DESCRIPTION
+
+        cls.test_query = cls.query_cls(test_title, test_description)
+
+        # According to
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/itemsDataQuery.yaml
+        # none of these fields are required, so they could all potentially be missing
+        cls.test_serialised_query = MappingProxyType({
+            "title": test_title,
+            "description": test_description,
+            "query_type": "items",
+        })
+
+    def test_from_json_spatial_query_keys(self):
         """
         GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
+        AND keys that are only valid for spatial data queries
         WHEN the dict is passed to from_json()
         THEN an InvalidEdrJsonError is raised
         """
-        test_json = self.test_serialised_radius_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_json = {
+            **self.test_serialised_query,
+            # The fields below this point aren't valid for Items Data Queries
+            "output_formats": test_output_formats,
+            "default_output_format": test_output_formats[0],
+            "crs_details": _TEST_CRS_DETAILS_JSON,
+        }
 
-        self.assertRaises(InvalidEdrJsonError, RadiusDataQuery.from_json, test_json)
+        with self.assertRaisesRegex(InvalidEdrJsonError, "Unexpected keys in JSON dict"):
+            self.query_cls.from_json(test_json)
 
 
-class TrajectoryDataQueryTest(unittest.TestCase):
+class CubeDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = CubeDataQuery
+    query_type = EdrDataQuery.CUBE
+    default_title = "Cube Data Query"
+    default_description = "Select data that is within a defined cube."
+    other_query_cls = AreaDataQuery
+    optional_list_kwargs = ("output_formats", "height_units")
 
-    def setUp(self) -> None:
-        test_title = "Trajectory Data Query"
-        test_description = "This is a description that doesn't describe anything"
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        test_crs_details = [CrsObject(4326), CrsObject(4277), CrsObject(4188)]
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Cube Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
+        test_height_units = ["m", "hPa"]
 
-        self.test_trajectory_query = TrajectoryDataQuery(
-            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
+        cls.test_query = cls.query_cls(
+            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details,
+            test_height_units,
+        )
 
         # According to
-        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/trajectoryDataQuery.yaml
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/8427963/standard/openapi/schemas/collections/cubeDataQuery.yaml
         # none of these fields are required, so they could all potentially be missing
-        self.test_serialised_trajectory_data_query = {
+        cls.test_serialised_query = MappingProxyType({
             "title": test_title,
             "description": test_description,
-            "query_type": "trajectory",
+            "query_type": "cube",
             "output_formats": test_output_formats,
             "default_output_format": test_output_formats[0],
-            "crs_details": {
-                crs.name: {"crs": crs.name, "wkt": crs.to_wkt()} for crs in test_crs_details
-            }
-        }
+            "crs_details": _TEST_CRS_DETAILS_JSON,
+            "height_units": test_height_units,
+        })
 
     def test_init_defaults(self):
-        """GIVEN no arguments are supplied WHEN a TrajectoryDataQuery is instantiated THEN default values are set"""
-        actual_trajectory_dq = TrajectoryDataQuery()
+        """GIVEN no arguments are supplied WHEN a CubeDataQuery is instantiated THEN default values are set"""
+        super().test_init_defaults()
+        actual_cube_dq = self._default_instance
 
-        self.assertEqual(actual_trajectory_dq.title, "Trajectory Data Query")
-        self.assertEqual(actual_trajectory_dq.description, "Select data that is within a defined trajectory.")
-        self.assertEqual(actual_trajectory_dq.get_query_type(), EdrDataQuery.TRAJECTORY)
-        self.assertEqual(actual_trajectory_dq.output_formats, [])
-        self.assertEqual(actual_trajectory_dq.default_output_format, None)
-        self.assertEqual(actual_trajectory_dq.crs_details, [CrsObject(4326)])
+        self.assertEqual(actual_cube_dq.height_units, [])
 
-    def test_init_default_output_format_inferred(self):
+    def test__neq__extra_fields(self):
         """
-        GIVEN output_formats is provided AND default_output_format is not
-        WHEN a TrajectoryDataQuery is instantiated
-        THEN default_output_format is inferred from the provided output_formats
+        This test checks that we've updated the equality comparison logic to include any attributes we've extended the
+        class with
+
+        GIVEN 2 CubeDataQuery instances
+        AND any attributes added to the class (i.e. those not defined by the superclass) differ
+        AND inherited fields are the same
+        WHEN they are compared
+        THEN they are not equal
         """
-        test_output_formats = ["application/netcdf", "application/geo+json", "application/prs.coverage+json"]
-        expected_default_output_format = test_output_formats[0]
+        json2 = {**self.test_serialised_query, "height_units": ["Eiffel Towers"]}
+        cdq2 = self.query_cls.from_json(json2)
+        self.assertNotEqual(cdq2, self.test_query)
 
-        test_trajectory_dq = TrajectoryDataQuery(output_formats=test_output_formats)
 
-        self.assertEqual(test_trajectory_dq.default_output_format, expected_default_output_format)
+class LocationsDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = LocationsDataQuery
+    query_type = EdrDataQuery.LOCATIONS
+    default_title = "Locations Data Query"
+    default_description = "Select data that is within a defined location."
+    other_query_cls = CorridorDataQuery
 
-    def test__eq__(self):
-        """GIVEN 2 TrajectoryDataQuery objects that have the same values WHEN they are compared THEN they are equal"""
-        self.assertEqual(TrajectoryDataQuery(), TrajectoryDataQuery())
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Locations Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
 
-        adq1 = TrajectoryDataQuery.from_json(self.test_serialised_trajectory_data_query)
-        adq2 = TrajectoryDataQuery.from_json(self.test_serialised_trajectory_data_query)
-        self.assertEqual(adq1, adq2)
+        cls.test_query = cls.query_cls(
+            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
 
-    def test__neq__(self):
-        """
-        GIVEN 2 TrajectoryDataQuery objects that have different values WHEN they are compared THEN they are not equal
-        """
-        self.assertNotEqual(self.test_trajectory_query, TrajectoryDataQuery())
-        self.assertNotEqual(TrajectoryDataQuery(), CorridorDataQuery())
+        # According to
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/locationsDataQuery.yaml
+        # none of these fields are required, so they could all potentially be missing
+        cls.test_serialised_query = MappingProxyType({
+            "title": test_title,
+            "description": test_description,
+            "query_type": "locations",
+            "output_formats": test_output_formats,
+            "default_output_format": test_output_formats[0],
+            "crs_details": _TEST_CRS_DETAILS_JSON
+        })
 
-    def test_to_json(self):
-        """GIVEN a TrajectoryDataQuery WHEN to_json() is called THEN the expected JSON is produced"""
-        expected_json = self.test_serialised_trajectory_data_query
 
-        actual_json = self.test_trajectory_query.to_json()
+class PositionDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = PositionDataQuery
+    query_type = EdrDataQuery.POSITION
+    default_title = "Position Data Query"
+    default_description = "Select data that is within a defined position."
+    other_query_cls = CorridorDataQuery
 
-        self.assertEqual(actual_json, expected_json)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Position Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
 
-    def test_to_json_defaults(self):
-        """
-        GIVEN a TrajectoryDataQuery created using default values
-        WHEN to_json() is called
-        THEN the expected JSON is produced
-        """
-        test_trajectory_dq = TrajectoryDataQuery()
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Trajectory Data Query",
-            "description": "Select data that is within a defined trajectory.",
-            "query_type": "trajectory",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
+        cls.test_query = cls.query_cls(
+            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
 
-        actual_json = test_trajectory_dq.to_json()
+        # According to
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/positionDataQuery.yaml
+        # none of these fields are required, so they could all potentially be missing
+        cls.test_serialised_query = MappingProxyType({
+            "title": test_title,
+            "description": test_description,
+            "query_type": "position",
+            "output_formats": test_output_formats,
+            "default_output_format": test_output_formats[0],
+            "crs_details": _TEST_CRS_DETAILS_JSON
+        })
 
-        self.assertEqual(expected_json, actual_json)
 
-    def test_to_json_output_formats_empty_list(self):
-        """
-        GIVEN output_formats is an empty list WHEN to_json() is called THEN output_formats is not included in the JSON
-        """
-        test_trajectory_dq = TrajectoryDataQuery(output_formats=[])
-        gps_crs = CrsObject(4326)
-        expected_json = {
-            "title": "Trajectory Data Query",
-            "description": "Select data that is within a defined trajectory.",
-            "query_type": "trajectory",
-            "crs_details": {
-                gps_crs.name: {
-                    "crs": gps_crs.name,
-                    "wkt": gps_crs.to_wkt(),
-                }
-            },
-        }
+class RadiusDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = RadiusDataQuery
+    query_type = EdrDataQuery.RADIUS
+    default_title = "Radius Data Query"
+    default_description = "Select data that is within a defined radius."
+    other_query_cls = AreaDataQuery
+    optional_list_kwargs = ("output_formats", "within_units")
 
-        actual_json = test_trajectory_dq.to_json()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Radius Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
+        test_within_units = ["m", "KM"]
 
-        self.assertEqual(actual_json, expected_json)
+        cls.test_query = cls.query_cls(
+            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details,
+            test_within_units
+        )
 
-    def test_from_json(self):
-        """
-        GIVEN a dict deserialised from valid JSON for a TrajectoryDataQuery
-        WHEN from_json() is called
-        THEN a TrajectoryDataQuery is returned with equivalent values
-        """
-        expected_adq = self.test_trajectory_query
+        # According to
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/8427963/standard/openapi/schemas/collections/radiusDataQuery.yaml
+        # none of these fields are required, so they could all potentially be missing
+        cls.test_serialised_query = MappingProxyType({
+            "title": test_title,
+            "description": test_description,
+            "query_type": "radius",
+            "output_formats": test_output_formats,
+            "default_output_format": test_output_formats[0],
+            "crs_details": _TEST_CRS_DETAILS_JSON,
+            "within_units": test_within_units,
+        })
 
-        actual_adq = TrajectoryDataQuery.from_json(self.test_serialised_trajectory_data_query)
+    def test_init_defaults(self):
+        """GIVEN no arguments are supplied WHEN a RadiusDataQuery is instantiated THEN default values are set"""
+        super().test_init_defaults()
+        actual_radius_dq = self._default_instance
 
-        self.assertEqual(actual_adq, expected_adq)
+        self.assertEqual([], actual_radius_dq.within_units)
 
-    def test_from_json_empty_dict(self):
-        """
-        GIVEN an empty dictionary
-        WHEN the empty dict is passed to from_json()
-        THEN a TrajectoryDataQuery with default values is returned
+    def test__neq__extra_fields(self):
         """
-        expected_trajectory_dq = TrajectoryDataQuery()
-
-        actual_trajectory_dq = TrajectoryDataQuery.from_json({})
-
-        self.assertEqual(actual_trajectory_dq, expected_trajectory_dq)
+        This test checks that we've updated the equality comparison logic to include any attributes we've extended the
+        class with
 
-    def test_from_json_query_type_wrong(self):
-        """
-        GIVEN a dict where the query_type key is not "trajectory"
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
+        GIVEN 2 RadiusDataQuery instances
+        AND any attributes added to the class (i.e. those not defined by the superclass) differ
+        AND inherited fields are the same
+        WHEN they are compared
+        THEN they are not equal
         """
+        json2 = {**self.test_serialised_query, "within_units": ["Eiffel Towers"]}
+        cdq2 = self.query_cls.from_json(json2)
+        self.assertNotEqual(cdq2, self.test_query)
 
-        self.assertRaises(InvalidEdrJsonError, TrajectoryDataQuery.from_json, {"query_type": "wrong!"})
-
-    def test_from_json_query_type_missing(self):
-        """
-        GIVEN a JSON dict that doesn't have a "query_type" key
-        WHEN the dict is passed to from_json()
-        THEN a TrajectoryDataQuery with equivalent values is returned
-        """
-        expected_trajectory_dq = self.test_trajectory_query
-        test_json = self.test_serialised_trajectory_data_query.copy()
-        del test_json["query_type"]
 
-        actual_trajectory_dq = TrajectoryDataQuery.from_json(test_json)
+class TrajectoryDataQueryTest(_SpatialDataQueryTestMixin, unittest.TestCase):
+    query_cls = TrajectoryDataQuery
+    query_type = EdrDataQuery.TRAJECTORY
+    default_title = "Trajectory Data Query"
+    default_description = "Select data that is within a defined trajectory."
+    other_query_cls = CorridorDataQuery
 
-        self.assertEqual(actual_trajectory_dq, expected_trajectory_dq)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        test_title = "Trajectory Data Query"
+        test_description = _TEST_DESCRIPTION
+        test_output_formats = _TEST_OUTPUT_FORMATS
+        test_crs_details = _TEST_CRS_DETAILS
 
-    def test_from_json_unexpected_key(self):
-        """
-        GIVEN a JSON dict that has all the expected keys with valid values
-        AND an unexpected key
-        WHEN the dict is passed to from_json()
-        THEN an InvalidEdrJsonError is raised
-        """
-        test_json = self.test_serialised_trajectory_data_query.copy()
-        test_json["what the hell is this?"] = "12355"
+        cls.test_query = cls.query_cls(
+            test_title, test_description, test_output_formats, test_output_formats[0], test_crs_details)
 
-        self.assertRaises(InvalidEdrJsonError, TrajectoryDataQuery.from_json, test_json)
+        # According to
+        # https://github.com/opengeospatial/ogcapi-environmental-data-retrieval/blob/a0ab69d/standard/openapi/schemas/collections/trajectoryDataQuery.yaml
+        # none of these fields are required, so they could all potentially be missing
+        cls.test_serialised_query = MappingProxyType({
+            "title": test_title,
+            "description": test_description,
+            "query_type": "trajectory",
+            "output_formats": test_output_formats,
+            "default_output_format": test_output_formats[0],
+            "crs_details": _TEST_CRS_DETAILS_JSON
+        })
 
 
 class DataQueryLinkTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.test_position_data_query = PositionDataQuery("Test Query")
+        cls.test_position_data_query_json = MappingProxyType(cls.test_position_data_query.to_json())
+        # One of each type of data query, for checking they're all (de)serialised correctly when embedded in a link
+        cls.test_data_queries = (
+            AreaDataQuery("Area Q", "test an area query", ["application/netcdf"]),
+            CorridorDataQuery(
+                "Corridor Q", "test a corridor query", ["application/netcdf"], width_units=["m", "km"],
+                height_units=["hPa"]),
+            CubeDataQuery("Cube Q", "test a cube query", ["application/netcdf"], height_units=["km", "mi"]),
+            ItemsDataQuery("Items Q", "test an items query"),
+            LocationsDataQuery("Locations Q", "test a locations query", ["application/netcdf"]),
+            PositionDataQuery("Position Q", "test a position query", ["application/netcdf"]),
+            RadiusDataQuery("Radius Q", "test a radius query", ["application/netcdf"], within_units=["m", "km"]),
+            TrajectoryDataQuery("Trajectory Q", "test a trajectory query", ["application/netcdf"]),
+        )
+
     def setUp(self) -> None:
-        test_position_data_query = PositionDataQuery("Test Query")
+        # Many tests modify the link and its JSON, so each test gets its own. Tests only modify the top level of the
+        # data query's JSON (e.g. removing its query_type), so a shallow copy of that is sufficient
         self.test_dql = DataQueryLink(
-            URL("https://localhost"), "alternate", "text", "en", "Test Link", 42, test_position_data_query)
+            URL("https://localhost"), "alternate", "text", "en", "Test Link", 42, self.test_position_data_query)
 
         self.test_json = {
             "title": "Test Link",
@@ -1557,7 +610,7 @@ class DataQueryLinkTest(unittest.TestCase):
             "hreflang": "en",
             "length": 42,
             "templated": True,
-            "variables": test_position_data_query.to_json(),
+            "variables": dict(self.test_position_data_query_json),
         }
 
     def test__eq__(self):
@@ -1621,7 +674,8 @@ class DataQueryLinkTest(unittest.TestCase):
         THEN an InvalidEdrJsonError is raised
         """
         self.test_json["what's this?"] = None
-        self.assertRaises(InvalidEdrJsonError, DataQueryLink.from_json, self.test_json)
+        with self.assertRaisesRegex(InvalidEdrJsonError, "Unexpected keys in JSON dict"):
+            DataQueryLink.from_json(self.test_json)
 
     def test_from_json_query_type_missing_from_variables(self):
         """
@@ -1632,123 +686,35 @@ class DataQueryLinkTest(unittest.TestCase):
         THEN an InvalidEdrJsonError is raised
         """
         del self.test_json["variables"]["query_type"]
-        # We only need to test absence, as invalid values are handled by the DataQuery class' `from_json` method
-        self.assertRaises(InvalidEdrJsonError, DataQueryLink.from_json, self.test_json)
-
-    def test_from_json_area_data_query(self):
-        """
-        GIVEN a DataQueryLink JSON dict with an embedded AreaDataQuery
-        WHEN from_json is called
-        THEN the correct objects are returned
-        """
-        test_area_query = AreaDataQuery("Area Q", "test an area query", ["application/netcdf"])
-        self.test_json["variables"] = test_area_query.to_json()
-        self.test_dql.variables = test_area_query
-
-        actual = DataQueryLink.from_json(self.test_json)
-
-        self.assertEqual(self.test_dql, actual)
-
-    def test_from_json_corridor_data_query(self):
-        """
-        GIVEN a DataQueryLink JSON dict with an embedded CorridorDataQuery
-        WHEN from_json is called
-        THEN the correct objects are returned
-        """
-        test_corridor_query = CorridorDataQuery(
-            "Corridor Q", "test an area query", ["application/netcdf"], width_units=["m", "km"], height_units=["hPa"])
-        self.test_json["variables"] = test_corridor_query.to_json()
-        self.test_dql.variables = test_corridor_query
-
-        actual = DataQueryLink.from_json(self.test_json)
-
-        self.assertEqual(self.test_dql, actual)
-
-    def test_from_json_items_data_query(self):
-        """
-        GIVEN a DataQueryLink JSON dict with an embedded ItemsDataQuery
-        WHEN from_json is called
-        THEN the correct objects are returned
-        """
-        test_items_query = ItemsDataQuery("Items Q", "test an area query")
-        self.test_json["variables"] = test_items_query.to_json()
-        self.test_dql.variables = test_items_query
-
-        actual = DataQueryLink.from_json(self.test_json)
-
-        self.assertEqual(self.test_dql, actual)
-
-    def test_from_json_cube_data_query(self):
-        """
-        GIVEN a DataQueryLink JSON dict with an embedded CubeDataQuery
-        WHEN from_json is called
-        THEN the correct objects are returned
-        """
-        test_cube_query = CubeDataQuery(
-            "Cube Q", "test an area query", ["application/netcdf"], height_units=["km", "mi"])
-        self.test_json["variables"] = test_cube_query.to_json()
-        self.test_dql.variables = test_cube_query
-
-        actual = DataQueryLink.from_json(self.test_json)
-
-        self.assertEqual(self.test_dql, actual)
-
-    def test_from_json_locations_data_query(self):
-        """
-        GIVEN a DataQueryLink JSON dict with an embedded LocationsDataQuery
-        WHEN from_json is called
-        THEN the correct objects are returned
-        """
-        test_locations_query = LocationsDataQuery("Locations Q", "test an area query", ["application/netcdf"])
-        self.test_json["variables"] = test_locations_query.to_json()
-        self.test_dql.variables = test_locations_query
-
-        actual = DataQueryLink.from_json(self.test_json)
-
-        self.assertEqual(self.test_dql, actual)
-
-    def test_from_json_position_data_query(self):
-        """
-        GIVEN a DataQueryLink JSON dict with an embedded PositionDataQuery
-        WHEN from_json is called
-        THEN the correct objects are returned
-        """
-        test_position_query = PositionDataQuery("Position Q", "test an area query", ["application/netcdf"])
-        self.test_json["variables"] = test_position_query.to_json()
-        self.test_dql.variables = test_position_query
-
-        actual = DataQueryLink.from_json(self.test_json)
-
-        self.assertEqual(self.test_dql, actual)
+        # Unrecognised values are tested separately; recognised but mismatched ones are the DataQuery class' concern
+        with self.assertRaisesRegex(InvalidEdrJsonError, "'query_type' missing from data query JSON"):
+            DataQueryLink.from_json(self.test_json)
 
-    def test_from_json_radius_data_query(self):
+    def test_from_json_query_type_unrecognised_in_variables(self):
         """
-        GIVEN a DataQueryLink JSON dict with an embedded RadiusDataQuery
+        GIVEN a JSON dict with all the possible acceptable fields
+        AND the "query_type" field in the "variables" field isn't a known data query type
         WHEN from_json is called
-        THEN the correct objects are returned
+        THEN an InvalidEdrJsonError is raised
         """
-        test_radius_query = RadiusDataQuery(
-            "Radius Q", "test an area query", ["application/netcdf"], within_units=["m", "km"])
-        self.test_json["variables"] = test_radius_query.to_json()
-        self.test_dql.variables = test_radius_query
-
-        actual = DataQueryLink.from_json(self.test_json)
+        self.test_json["variables"]["query_type"] = "wrong!"
+        with self.assertRaisesRegex(InvalidEdrJsonError, "Unrecognised 'query_type' in data query JSON: 'wrong!'"):
+            DataQueryLink.from_json(self.test_json)
 
-        self.assertEqual(self.test_dql, actual)
-
-    def test_from_json_trajectory_data_query(self):
+    def test_from_json_data_queries(self):
         """
-        GIVEN a DataQueryLink JSON dict with an embedded TrajectoryDataQuery
+        GIVEN a DataQueryLink JSON dict with an embedded data query
         WHEN from_json is called
-        THEN the correct objects are returned
+        THEN the correct objects are returned, for every type of data query
         """
-        test_trajectory_query = TrajectoryDataQuery("Trajectory Q", "test an area query", ["application/netcdf"])
-        self.test_json["variables"] = test_trajectory_query.to_json()
-        self.test_dql.variables = test_trajectory_query
+        for test_query in self.test_data_queries:
+            with self.subTest(query_type=test_query.get_query_type()):
+                self.test_json["variables"] = test_query.to_json()
+                self.test_dql.variables = test_query
 
-        actual = DataQueryLink.from_json(self.test_json)
+                actual = DataQueryLink.from_json(self.test_json)
 
-        self.assertEqual(self.test_dql, actual)
+                self.assertEqual(self.test_dql, actual)
 
     def test_to_json_all_fields(self):
         """GIVEN a DataQueryLink with all fields set WHEN to_json is called THEN the correct JSON dict is produced"""
@@ -1791,120 +757,20 @@ class DataQueryLinkTest(unittest.TestCase):
 
         self.assertEqual(expected_json, actual)
 
-    def test_to_json_area_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded AreaDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_area_query = AreaDataQuery("Area Q", "test an area query", ["application/netcdf"])
-        self.test_dql.variables = test_area_query
-        self.test_json["variables"] = test_area_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_corridor_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded CorridorDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_corridor_query = CorridorDataQuery(
-            "Corridor Q", "test an corridor query", ["application/netcdf"], width_units=["m"], height_units=["m"])
-        self.test_dql.variables = test_corridor_query
-        self.test_json["variables"] = test_corridor_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_items_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded ItemsDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_items_query = ItemsDataQuery("Items Q", "test an items query")
-        self.test_dql.variables = test_items_query
-        self.test_json["variables"] = test_items_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_cube_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded CubeDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_cube_query = CubeDataQuery(
-            "Cube Q", "test an cube query", ["application/netcdf"], height_units=["km", "mi"])
-        self.test_dql.variables = test_cube_query
-        self.test_json["variables"] = test_cube_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_locations_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded LocationsDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_locations_query = LocationsDataQuery("Locations Q", "test an locations query", ["application/netcdf"])
-        self.test_dql.variables = test_locations_query
-        self.test_json["variables"] = test_locations_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_position_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded PositionDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_position_query = PositionDataQuery("Position Q", "test an position query", ["application/netcdf"])
-        self.test_dql.variables = test_position_query
-        self.test_json["variables"] = test_position_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_radius_data_query(self):
+    def test_to_json_data_queries(self):
         """
-        GIVEN a DataQueryLink instance with an embedded RadiusDataQuery
+        GIVEN a DataQueryLink instance with an embedded data query
         WHEN to_json is called
-        THEN the correct JSON dict is returned
+        THEN the correct JSON dict is returned, for every type of data query
         """
-        test_radius_query = RadiusDataQuery(
-            "Radius Q", "test an radius query", ["application/netcdf"], within_units=["m", "ft"])
-        self.test_dql.variables = test_radius_query
-        self.test_json["variables"] = test_radius_query.to_json()
+        for test_query in self.test_data_queries:
+            with self.subTest(query_type=test_query.get_query_type()):
+                self.test_dql.variables = test_query
+                self.test_json["variables"] = test_query.to_json()
 
-        actual = self.test_dql.to_json()
+                actual = self.test_dql.to_json()
 
-        self.assertEqual(self.test_json, actual)
-
-    def test_to_json_trajectory_data_query(self):
-        """
-        GIVEN a DataQueryLink instance with an embedded TrajectoryDataQuery
-        WHEN to_json is called
-        THEN the correct JSON dict is returned
-        """
-        test_trajectory_query = TrajectoryDataQuery("Trajectory Q", "test an trajectory query", ["application/netcdf"])
-        self.test_dql.variables = test_trajectory_query
-        self.test_json["variables"] = test_trajectory_query.to_json()
-
-        actual = self.test_dql.to_json()
-
-        self.assertEqual(self.test_json, actual)
+                self.assertEqual(self.test_json, actual)
 
     def test_templated_variables_set(self):
         """
@@ -1935,26 +801,17 @@ class DataQueryMapTest(unittest.TestCase):
         actual_keys = set(DATA_QUERY_MAP.keys())
         self.assertEqual(expected_keys, actual_keys)
 
-    def test_area(self):
-        self.assertEqual(AreaDataQuery, DATA_QUERY_MAP["area"])
-
-    def test_corridor(self):
-        self.assertEqual(CorridorDataQuery, DATA_QUERY_MAP["corridor"])
-
-    def test_items(self):
-        self.assertEqual(ItemsDataQuery, DATA_QUERY_MAP["items"])
-
-    def test_cube(self):
-        self.assertEqual(CubeDataQuery, DATA_QUERY_MAP["cube"])
-
-    def test_locations(self):
-        self.assertEqual(LocationsDataQuery, DATA_QUERY_MAP["locations"])
-
-    def test_position(self):
-        self.assertEqual(PositionDataQuery, DATA_QUERY_MAP["position"])
-
-    def test_radius(self):
-        self.assertEqual(RadiusDataQuery, DATA_QUERY_MAP["radius"])
-
-    def test_trajectory(self):
-        self.assertEqual(TrajectoryDataQuery, DATA_QUERY_MAP["trajectory"])
+    def test_query_classes(self):
+        expected_classes = {
+            "area": AreaDataQuery,
+            "corridor": CorridorDataQuery,
+            "items": ItemsDataQuery,
+            "cube": CubeDataQuery,
+            "locations": LocationsDataQuery,
+            "position": PositionDataQuery,
+            "radius": RadiusDataQuery,
+            "trajectory": TrajectoryDataQuery,
+        }
+        for query_type, expected_cls in expected_classes.items():
+            with self.subTest(query_type=query_type):
+                self.assertEqual(expected_cls, DATA_QUERY_MAP[query_type])